@@ -12,38 +12,59 @@ import argparse
 import sys
 import os
 import re
+import shutil
 from datetime import datetime
 from typing import Dict, List, Tuple, Optional
 
 class PasswordCrackingBenchmark:
+    # Hashcat modes requested by benchmark_hashcat
+    HASHCAT_MODES = {
+        '0': 'MD5',
+        '100': 'SHA1',
+        '1400': 'SHA256',
+        '3200': 'bcrypt',
+        '1800': 'SHA512'
+    }
+    
+    # SI prefix (upper-cased) captured by the patterns below -> multiplier
+    SPEED_MULTIPLIERS = {'': 1.0, 'K': 1e3, 'M': 1e6, 'G': 1e9, 'T': 1e12}
+    
+    # Matches either a mode header ("Hashmode: 0 - MD5" / "* Hash-Mode 0 (MD5)")
+    # or a device speed line ("Speed.#1.........:  5693.5 MH/s (92.77ms) ...")
+    HASHCAT_PATTERN = re.compile(
+        r'^\*?\s*Hash-?[Mm]ode:?\s*(?P<mode>\d+)'
+        r'|^Speed\.(?:Dev\.)?#[\d*]+\.*:\s*(?P<speed>(?P<value>\d+(?:\.\d+)?)\s*(?P<prefix>[kMGT]?)H/s)',
+        re.MULTILINE
+    )
+    
+    # Matches either a format header ("Benchmarking: Raw-MD5 [MD5 ...]... DONE")
+    # or a rate line ("Raw:\t93677K c/s real, 93677K c/s virtual")
+    JOHN_PATTERN = re.compile(
+        r'^Benchmarking:\s*(?P<format>[^\s,\[]+)'
+        r'|^(?P<label>[^:\n]+):\s*(?P<speed>(?P<value>\d+(?:\.\d+)?)(?P<prefix>[KMG]?)\s*c/s)',
+        re.MULTILINE | re.IGNORECASE
+    )
+    
+    # CPU/memory details from /proc, read once per process
+    _hardware_info = None
+    
     def __init__(self):
         self.results = {}
+        # One clock read shared by the report file names and system_info
+        self._now = datetime.now()
+        self.timestamp = self._now.strftime("%Y%m%d_%H%M%S")
         self.system_info = self.gather_system_info()
-        self.timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         
     def gather_system_info(self) -> Dict:
         """Collect system information for benchmark context."""
         system_info = {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': self._now.isoformat(),
             'platform': sys.platform
         }
         
         try:
-            # CPU information
-            if os.path.exists('/proc/cpuinfo'):
-                with open('/proc/cpuinfo', 'r') as f:
-                    cpu_info = f.read()
-                    cpu_model = re.search(r'model name\s*:\s*(.+)', cpu_info)
-                    if cpu_model:
-                        system_info['cpu'] = cpu_model.group(1).strip()
-                        
-            # Memory information
-            if os.path.exists('/proc/meminfo'):
-                with open('/proc/meminfo', 'r') as f:
-                    mem_info = f.read()
-                    mem_total = re.search(r'MemTotal:\s*(\d+)', mem_info)
-                    if mem_total:
-                        system_info['memory_gb'] = int(mem_total.group(1)) // 1024 // 1024
+            # CPU and memory information
+            system_info.update(self._read_hardware_info())
                         
             # GPU information (if available)
             try:
@@ -59,21 +80,42 @@ class PasswordCrackingBenchmark:
             
         return system_info
     
+    @classmethod
+    def _read_hardware_info(cls) -> Dict:
+        """Read CPU model and total memory from /proc, caching the result."""
+        if cls._hardware_info is not None:
+            return cls._hardware_info
+            
+        hardware_info = {}
+        
+        # Stop at the first match; cpuinfo repeats per core and can be large
+        if os.path.exists('/proc/cpuinfo'):
+            with open('/proc/cpuinfo', 'r') as f:
+                for line in f:
+                    if line.startswith('model name'):
+                        hardware_info['cpu'] = line.split(':', 1)[1].strip()
+                        break
+                        
+        if os.path.exists('/proc/meminfo'):
+            with open('/proc/meminfo', 'r') as f:
+                for line in f:
+                    if line.startswith('MemTotal:'):
+                        hardware_info['memory_gb'] = int(line.split()[1]) // 1024 // 1024
+                        break
+                        
+        cls._hardware_info = hardware_info
+        return hardware_info
+    
     def check_tool_availability(self) -> Tuple[bool, bool]:
         """Check if Hashcat and John the Ripper are available."""
-        hashcat_available = False
-        john_available = False
+        # A PATH lookup answers this without spawning either tool
+        hashcat_available = shutil.which('hashcat') is not None
+        john_available = shutil.which('john') is not None
         
-        try:
-            subprocess.run(['hashcat', '--version'], capture_output=True, timeout=5)
-            hashcat_available = True
-        except:
+        if not hashcat_available:
             print("Warning: Hashcat not found or not accessible")
             
-        try:
-            subprocess.run(['john', '--version'], capture_output=True, timeout=5)
-            john_available = True
-        except:
+        if not john_available:
             print("Warning: John the Ripper not found or not accessible")
             
         return hashcat_available, john_available
@@ -102,47 +144,24 @@ class PasswordCrackingBenchmark:
     def parse_hashcat_benchmark(self, output: str) -> Dict:
         """Parse Hashcat benchmark output."""
         results = {}
-        hash_types = {
-            '0': 'MD5',
-            '100': 'SHA1', 
-            '1400': 'SHA256',
-            '3200': 'bcrypt',
-            '1800': 'SHA512'
-        }
+        hash_type = None
         
-        lines = output.split('\n')
-        for line in lines:
-            if 'H/s' in line:
-                parts = line.split()
-                for i, part in enumerate(parts):
-                    if part in hash_types:
-                        try:
-                            # Find the H/s value
-                            for j in range(i+1, len(parts)):
-                                if 'H/s' in parts[j]:
-                                    speed_str = parts[j-1]
-                                    speed = self.parse_hashcat_speed(speed_str)
-                                    results[hash_types[part]] = {
-                                        'speed_hs': speed,
-                                        'speed_formatted': parts[j-1] + ' ' + parts[j]
-                                    }
-                                    break
-                        except:
-                            continue
-                            
+        for match in self.HASHCAT_PATTERN.finditer(output):
+            if match.group('mode') is not None:
+                hash_type = self.HASHCAT_MODES.get(match.group('mode'))
+            elif hash_type:
+                # Later lines win, so the "Speed.#*" multi-device total
+                # replaces the per-device figures
+                results[hash_type] = {
+                    'speed_hs': self.parse_speed(match),
+                    'speed_formatted': match.group('speed')
+                }
+                
         return results
     
-    def parse_hashcat_speed(self, speed_str: str) -> float:
-        """Parse Hashcat speed string to numeric value."""
-        multipliers = {'k': 1e3, 'M': 1e6, 'G': 1e9, 'T': 1e12}
-        
-        try:
-            if speed_str[-1] in multipliers:
-                return float(speed_str[:-1]) * multipliers[speed_str[-1]]
-            else:
-                return float(speed_str)
-        except:
-            return 0.0
+    def parse_speed(self, match: re.Match) -> float:
+        """Convert a benchmark pattern match's value and SI prefix to a rate."""
+        return float(match.group('value')) * self.SPEED_MULTIPLIERS[match.group('prefix').upper()]
     
     def benchmark_john(self) -> Dict:
         """Run John the Ripper benchmark."""
@@ -164,41 +183,29 @@ class PasswordCrackingBenchmark:
     def parse_john_benchmark(self, output: str) -> Dict:
         """Parse John the Ripper benchmark output."""
         results = {}
+        format_name = None
         
-        lines = output.split('\n')
-        for line in lines:
-            if 'c/s' in line.lower():
-                # Extract hash type and speed
-                if ':' in line:
-                    parts = line.split(':')
-                    if len(parts) >= 2:
-                        hash_type = parts[0].strip()
-                        speed_part = parts[1].strip()
-                        
-                        # Extract speed value
-                        speed_match = re.search(r'(\d+(?:\.\d+)?[KMG]?)\s*c/s', speed_part, re.IGNORECASE)
-                        if speed_match:
-                            speed_str = speed_match.group(1)
-                            speed = self.parse_john_speed(speed_str)
-                            results[hash_type] = {
-                                'speed_cs': speed,
-                                'speed_formatted': speed_match.group(0)
-                            }
+        for match in self.JOHN_PATTERN.finditer(output):
+            if match.group('format') is not None:
+                format_name = match.group('format')
+                continue
+                
+            # Salted formats report "Many salts" and "Only one salt" rates
+            label = match.group('label').strip()
+            if format_name is None:
+                hash_type = label
+            elif label == 'Raw':
+                hash_type = format_name
+            else:
+                hash_type = f"{format_name} ({label})"
+                
+            results[hash_type] = {
+                'speed_cs': self.parse_speed(match),
+                'speed_formatted': match.group('speed')
+            }
                             
         return results
     
-    def parse_john_speed(self, speed_str: str) -> float:
-        """Parse John the Ripper speed string to numeric value."""
-        multipliers = {'K': 1e3, 'M': 1e6, 'G': 1e9}
-        
-        try:
-            if speed_str[-1] in multipliers:
-                return float(speed_str[:-1]) * multipliers[speed_str[-1]]
-            else:
-                return float(speed_str)
-        except:
-            return 0.0
-    
     def run_attack_performance_test(self) -> Dict:
         """Run actual attack performance tests with sample data."""
         print("Running attack performance tests...")
@@ -296,26 +303,28 @@ class PasswordCrackingBenchmark:
         """Save benchmark results to files."""
         # Save JSON report
         json_file = os.path.join(output_dir, f"performance_report_{self.timestamp}.json")
+        # json.dumps + one write avoids json.dump's many small chunk writes
         with open(json_file, 'w') as f:
-            json.dump(report, f, indent=2)
+            f.write(json.dumps(report, indent=2))
         
         # Save CSV summary
+        rows = [['Tool', 'Hash Type', 'Speed (H/s)', 'Speed Formatted']]
+        
+        # Hashcat results
+        hashcat_data = report.get('benchmarks', {}).get('hashcat', {})
+        rows.extend(['Hashcat', hash_type, data.get('speed_hs', 0),
+                     data.get('speed_formatted', '')]
+                    for hash_type, data in hashcat_data.items())
+        
+        # John the Ripper results
+        john_data = report.get('benchmarks', {}).get('john_the_ripper', {})
+        rows.extend(['John the Ripper', hash_type, data.get('speed_cs', 0),
+                     data.get('speed_formatted', '')]
+                    for hash_type, data in john_data.items())
+        
         csv_file = os.path.join(output_dir, f"performance_summary_{self.timestamp}.csv")
         with open(csv_file, 'w', newline='') as f:
-            writer = csv.writer(f)
-            writer.writerow(['Tool', 'Hash Type', 'Speed (H/s)', 'Speed Formatted'])
-            
-            # Hashcat results
-            hashcat_data = report.get('benchmarks', {}).get('hashcat', {})
-            for hash_type, data in hashcat_data.items():
-                writer.writerow(['Hashcat', hash_type, data.get('speed_hs', 0), 
-                               data.get('speed_formatted', '')])
-            
-            # John the Ripper results  
-            john_data = report.get('benchmarks', {}).get('john_the_ripper', {})
-            for hash_type, data in john_data.items():
-                writer.writerow(['John the Ripper', hash_type, data.get('speed_cs', 0), 
-                               data.get('speed_formatted', '')])
+            csv.writer(f).writerows(rows)
         
         print(f"Results saved to:")
         print(f"  JSON Report: {json_file}")